@@ -8,13 +8,192 @@ for convenience.
 """
 
 import argparse
+import asyncio
+from base64 import b64encode as _stdlib_b64encode
+import glob
 from pathlib import Path
+from types import MappingProxyType
 import os
 import json
-import base64
-import codecs
+import functools
+import hashlib
+import io
+import mmap
+import sys
 
-from openai import OpenAI
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient, DefaultHttpxClient, OpenAI
+
+# pybase64 provides SIMD base64 kernels; fall back to the stdlib if missing
+try:
+    from pybase64 import b64encode as _b64encode
+    _HAVE_PYBASE64 = True
+except ImportError:
+    _b64encode = _stdlib_b64encode
+    _HAVE_PYBASE64 = False
+
+# Pillow is only needed to downscale oversized images
+try:
+    from PIL import Image, ImageOps
+except ImportError:
+    Image = None
+
+# orjson is a faster drop-in for the config file; fall back to the stdlib
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj):
+        # Use ensure_ascii=False to prevent Unicode escaping
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+# Numba base64 encoder: None until it is built, False if it is unavailable
+_numba_b64encoder = None
+
+
+def _get_numba_b64encoder():
+    """
+    Get a Numba-compiled base64 encoder, or None if it should not be used.
+
+    It only stands in for the stdlib encoder when pybase64 is missing. Numba
+    also takes longer to import than it saves on any single image, so the
+    encoder is only built once the process has imported it; until then this
+    keeps checking on every call.
+    """
+    global _numba_b64encoder
+    if _numba_b64encoder is None and not _HAVE_PYBASE64 and "numba" in sys.modules:
+        _numba_b64encoder = _build_numba_b64encoder() or False
+    return _numba_b64encoder or None
+
+
+def _build_numba_b64encoder():
+    """Compile the Numba base64 encoder, or return None if that fails."""
+    try:
+        import numba
+        import numpy as np
+    except ImportError:
+        return None
+
+    @numba.njit(cache=True, boundscheck=False, nogil=True)
+    def b64encode_into(src, dst, alphabet):
+        # Encode whole 3-byte groups of src into dst, 4 characters per group
+        for i in range(src.shape[0] // 3):
+            word = ((np.uint32(src[3 * i]) << 16) | (np.uint32(src[3 * i + 1]) << 8)
+                    | np.uint32(src[3 * i + 2]))
+            dst[4 * i] = alphabet[word >> 18]
+            dst[4 * i + 1] = alphabet[(word >> 12) & 63]
+            dst[4 * i + 2] = alphabet[(word >> 6) & 63]
+            dst[4 * i + 3] = alphabet[word & 63]
+
+    alphabet = np.frombuffer(
+        b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/", np.uint8)
+
+    def encode(src, dst):
+        """Encode the whole groups of buffer src into writable buffer dst."""
+        b64encode_into(np.frombuffer(src, np.uint8), np.frombuffer(dst, np.uint8), alphabet)
+
+    # Only use the kernel if it matches the stdlib around the 3-byte group and
+    # encode chunk boundaries
+    sample = bytes(range(256)) * (Eye.ENCODE_CHUNK_SIZE // 256 + 1)
+    for size in (*range(3, 9), *range(Eye.ENCODE_CHUNK_SIZE - 2, Eye.ENCODE_CHUNK_SIZE + 3)):
+        whole = size - size % 3
+        dst = bytearray(whole // 3 * 4)
+        encode(memoryview(sample)[:whole], dst)
+        if dst != _stdlib_b64encode(sample[:whole]):
+            return None
+    return encode
+
+
+def _make_http_client(client_class):
+    """Create a keep-alive HTTP client, using HTTP/2 if h2 is installed."""
+    limits = httpx.Limits(max_keepalive_connections=4, keepalive_expiry=60)
+    try:
+        return client_class(http2=True, limits=limits)
+    except ImportError:
+        return client_class(limits=limits)
+
+
+@functools.lru_cache(maxsize=4)
+def _get_client(base_url, api_token):
+    """
+    Get an API client for the given endpoint and token.
+
+    Clients are shared across Eye instances so that repeated queries in one
+    process reuse the same connection pool and TLS sessions.
+    """
+    return OpenAI(
+        api_key=api_token,
+        base_url=base_url,
+        http_client=_make_http_client(DefaultHttpxClient),
+    )
+
+
+class _OutputBuffer:
+    """
+    Collect streamed response text and write it to stdout in batches.
+
+    Output is flushed at every line break and whenever more than limit bytes
+    are pending, so it still appears promptly without one write per token.
+    Streams without a binary buffer, such as io.StringIO or notebook output,
+    are written to as text instead.
+    """
+
+    def __init__(self, stream=None, limit=4096):
+        self.stream = stream or sys.stdout
+        # Keep earlier text output ordered before the bytes written below
+        self.stream.flush()
+        self.out = getattr(self.stream, "buffer", None)
+        self.encoding = getattr(self.stream, "encoding", None) or "utf-8"
+        self.errors = getattr(self.stream, "errors", None) or "strict"
+        self.limit = limit
+        self.pending = bytearray() if self.out is not None else []
+        self.pending_size = 0
+
+    def write(self, text):
+        if self.out is not None:
+            self.pending += text.encode(self.encoding, self.errors)
+            self.pending_size = len(self.pending)
+        else:
+            self.pending.append(text)
+            self.pending_size += len(text)
+        if "\n" in text or self.pending_size > self.limit:
+            self.flush()
+
+    def flush(self):
+        if self.out is not None:
+            if self.pending:
+                self.out.write(self.pending)
+                self.pending.clear()
+            self.out.flush()
+        else:
+            if self.pending:
+                self.stream.write("".join(self.pending))
+                self.pending.clear()
+            self.stream.flush()
+        self.pending_size = 0
+
+
+# Content types of the supported image formats (excluding GIF), keyed by
+# lowercase file extension
+_CONTENT_TYPES = MappingProxyType({
+    '.png': 'image/png',
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.bmp': 'image/bmp',
+    '.webp': 'image/webp',
+    '.tiff': 'image/tiff',
+    '.tif': 'image/tiff'
+})
+
+# Lowercase file extensions accepted by validate_image
+_VALID_EXTS = frozenset(_CONTENT_TYPES)
 
 
 class Eye:
@@ -32,7 +211,16 @@ class Eye:
         "qwen-vl-ocr-latest"
     ]
 
-    def __init__(self, image_path, query_text=None, model_name=None, base_url=None, api_token=None):
+    # Images are base64-encoded in chunks of this many bytes; a multiple of 3
+    # so that every chunk encodes to whole base64 quanta without padding.
+    ENCODE_CHUNK_SIZE = 3 * 64 * 1024
+
+    # Parsed config file shared by all instances, as
+    # ((path, st_mtime_ns, st_size), config), or None before the first load
+    _config_cache = None
+
+    def __init__(self, image_path, query_text=None, model_name=None, base_url=None, api_token=None,
+                 use_cache=True, max_side=None, quality=None):
         """
         Initialize the Eye processor.
 
@@ -42,34 +230,42 @@ class Eye:
             model_name (str, optional): Model to use for processing
             base_url (str, optional): API base URL
             api_token (str, optional): API token for authentication
+            use_cache (bool, optional): Reuse responses cached for the same
+                model, query and image instead of calling the API again
+            max_side (int, optional): Downscale images whose longer side
+                exceeds this many pixels before sending them; 0 disables
+            quality (int, optional): JPEG quality for downscaled images
         """
         self.config_file = Path.home() / ".heye"
-        self._setup_configuration(query_text, model_name, base_url, api_token)
+        self.cache_dir = Path.home() / ".heye_cache"
+        self.use_cache = use_cache
+        self._setup_configuration(query_text, model_name, base_url, api_token,
+                                  max_side, quality)
         # self._validate_model()
 
         self.image_path = image_path
 
-        self.client = OpenAI(
-            api_key=self.api_token,
-            base_url=self.base_url,
-        )
+        self.client = _get_client(self.base_url, self.api_token)
 
-    def _setup_configuration(self, query_text, model_name, base_url, api_token):
+    def _setup_configuration(self, query_text, model_name, base_url, api_token,
+                             max_side=None, quality=None):
         """Set up configuration from file and command line arguments."""
         config = self.load_config()
 
-        # Update config if new values provided
-        if base_url is not None:
-            config['base_url'] = base_url
-        if api_token is not None:
-            config['api_token'] = api_token
-        if model_name is not None:
-            config['model_name'] = model_name
-        if query_text is not None:
-            config['query_text'] = query_text
-
-        # Save config if any new values were provided
-        if base_url is not None or api_token is not None or model_name is not None or query_text is not None:
+        # Only write the config back if a provided value differs from it
+        updates = {
+            key: value for key, value in (
+                ('base_url', base_url),
+                ('api_token', api_token),
+                ('model_name', model_name),
+                ('query_text', query_text),
+                ('max_side', max_side),
+                ('quality', quality),
+            )
+            if value is not None and config.get(key) != value
+        }
+        if updates:
+            config.update(updates)
             self.save_config(config)
 
         # Use config values or defaults
@@ -81,6 +277,8 @@ class Eye:
             'model_name', "qwen3-vl-plus")
         self.query_text = query_text or config.get(
             'query_text', "What scene is depicted in the image?")
+        self.max_side = config.get('max_side', 0)
+        self.quality = config.get('quality', 85)
 
     def _validate_model(self):
         """Validate that the selected model is supported."""
@@ -90,57 +288,227 @@ class Eye:
 
     # Configuration methods
     def load_config(self):
-        """Load configuration from file."""
-        if self.config_file.exists():
+        """
+        Load configuration from file.
+
+        The parsed file is cached on the class until its modification time or
+        size changes, so the result is a shallow copy that is safe to modify.
+        """
+        try:
+            st = self.config_file.stat()
+        except OSError:
+            return {}
+        key = (str(self.config_file), st.st_mtime_ns, st.st_size)
+        if Eye._config_cache is None or Eye._config_cache[0] != key:
             try:
-                # Use codecs to ensure proper encoding handling
-                with codecs.open(self.config_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, IOError, UnicodeDecodeError):
-                return {}
-        return {}
+                config = _json_loads(self.config_file.read_bytes())
+            # orjson.JSONDecodeError is a subclass of json.JSONDecodeError
+            except (json.JSONDecodeError, OSError, UnicodeDecodeError):
+                config = {}
+            Eye._config_cache = (key, config)
+        return dict(Eye._config_cache[1])
 
     def save_config(self, config):
         """Save configuration to file with proper Unicode handling."""
         try:
-            # Use codecs to ensure proper encoding handling
-            with codecs.open(self.config_file, 'w', encoding='utf-8') as f:
-                # Use ensure_ascii=False to prevent Unicode escaping
-                json.dump(config, f, indent=2, ensure_ascii=False)
-        except IOError as e:
+            # Non-ASCII text is written as UTF-8 rather than escaped
+            self.config_file.write_bytes(_json_dumps(config))
+            st = self.config_file.stat()
+        except OSError as e:
             print(f"Warning: Could not save config to {self.config_file}: {e}")
+            return
+        # What was just written need not be parsed again
+        key = (str(self.config_file), st.st_mtime_ns, st.st_size)
+        Eye._config_cache = (key, dict(config))
 
     # Image processing methods
-    def validate_image(self, image_path):
-        """Validate that the image file exists and is of a supported format."""
-        if not os.path.exists(image_path):
-            raise FileNotFoundError(f"{image_path} does not exist.")
-
-        # Supported image formats (excluding GIF)
-        supported_extensions = (".png", ".jpg", ".jpeg",
-                                ".bmp", ".webp", ".tiff", ".tif")
-        if not image_path.lower().endswith(supported_extensions):
+    @staticmethod
+    def get_image_extension(image_path):
+        """Get the lowercase file extension of the image, including the dot."""
+        return os.path.splitext(image_path)[1].lower()
+
+    def validate_image(self, image_path, extension=None):
+        """
+        Validate that the image file is of a supported format.
+
+        Whether the file exists is checked when encode_image opens it.
+        """
+        if extension is None:
+            extension = self.get_image_extension(image_path)
+        if extension not in _VALID_EXTS:
             raise ValueError(
                 f"{image_path} is not a valid image file. Supported formats: PNG, JPG, JPEG, BMP, WEBP, TIFF, TIF")
 
+    def resize_image(self, image_file):
+        """
+        Downscale an open image file to fit within max_side pixels.
+
+        Returns the image re-encoded as JPEG, or None if it already fits, Pillow
+        is not installed or Pillow cannot decode it; the original bytes are
+        sent in those cases.
+        """
+        if Image is None:
+            print("Warning: Pillow is not installed, sending the image without resizing")
+            return None
+
+        try:
+            return self._resize_image(image_file)
+        # UnidentifiedImageError and truncated or corrupt data are OSErrors
+        except (OSError, ValueError, Image.DecompressionBombError) as e:
+            print(f"Warning: Could not resize {image_file.name}, sending it unchanged: {e}")
+            return None
+
+    def _resize_image(self, image_file):
+        """Downscale and re-encode an open image file; see resize_image."""
+        with Image.open(image_file) as image:
+            if max(image.size) <= self.max_side:
+                return None
+            # Rotate as the EXIF orientation says, as that tag is not kept
+            image = ImageOps.exif_transpose(image)
+            if image.mode in ("RGBA", "LA", "PA") or "transparency" in image.info:
+                # JPEG has no alpha channel, so flatten onto white
+                image = image.convert("RGBA")
+                background = Image.new("RGB", image.size, (255, 255, 255))
+                background.paste(image, mask=image.getchannel("A"))
+                image = background
+            elif image.mode != "RGB":
+                image = image.convert("RGB")
+            image.thumbnail((self.max_side, self.max_side), Image.Resampling.LANCZOS)
+
+            resized = io.BytesIO()
+            image.save(resized, format="JPEG", quality=self.quality)
+        return resized.getbuffer()
+
+    def sniff_content_type(self, header):
+        """
+        Get the content type from the leading magic bytes of an image.
+
+        Returns None if the header matches none of the supported formats.
+        """
+        if header[:3] == b'\xff\xd8\xff':
+            return 'image/jpeg'
+        if header[:8] == b'\x89PNG\r\n\x1a\n':
+            return 'image/png'
+        if header[:4] == b'RIFF' and header[8:12] == b'WEBP':
+            return 'image/webp'
+        if header[:4] in (b'II*\x00', b'MM\x00*'):
+            return 'image/tiff'
+        if header[:2] == b'BM':
+            return 'image/bmp'
+        return None
+
     def encode_image(self, image_path):
-        """Encode image file to base64 string."""
-        with open(image_path, "rb") as image_file:
-            return base64.b64encode(image_file.read()).decode("utf-8")
+        """Encode image file to a base64 data URL, returned as ASCII bytes."""
+        return self._prepare_payload(image_path, hash_image=False)[0]
 
-    def get_image_content_type(self, image_path):
+    def _prepare_payload(self, image_path, hash_image=True):
+        """
+        Read, hash, encode and identify an image file in a single pass.
+
+        Returns (data_url, content_type, image_hash): the base64 data URL as
+        ASCII bytes, its content type and the SHA-256 hex digest of the image
+        bytes being sent, or None for the digest unless hash_image is set.
+
+        Images larger than max_side are downscaled and sent as JPEG first.
+        Otherwise the file is memory-mapped, its content type is detected from
+        its magic bytes, falling back to the file extension, and it is encoded
+        as is. Either way the image is hashed and encoded chunk by chunk
+        straight into a preallocated buffer that already holds the ``data:``
+        prefix, so the file is only read once and the raw bytes, the base64
+        text and the final URL never exist as separate full-size copies.
+        """
+        digest = hashlib.sha256() if hash_image else None
+        try:
+            image_file = open(image_path, "rb")
+        except FileNotFoundError:
+            raise FileNotFoundError(f"{image_path} does not exist.") from None
+        with image_file:
+            resized = self.resize_image(image_file) if self.max_side else None
+            if resized is not None:
+                content_type = "image/jpeg"
+                image_url = self._encode_data_url(resized, content_type, digest)
+            elif not os.fstat(image_file.fileno()).st_size:
+                content_type = self.get_image_content_type(image_path)
+                image_url = self._encode_data_url(b"", content_type, digest)
+            else:
+                with mmap.mmap(image_file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    content_type = (self.sniff_content_type(mm[:12])
+                                    or self.get_image_content_type(image_path))
+                    image_url = self._encode_data_url(mm, content_type, digest)
+        return image_url, content_type, digest and digest.hexdigest()
+
+    def _encode_data_url(self, data, content_type, digest=None):
+        """Base64-encode a bytes-like object into a preallocated data URL buffer."""
+        prefix = f"data:{content_type};base64,".encode("ascii")
+        size = len(data)
+        buf = bytearray(len(prefix) + 4 * ((size + 2) // 3))
+        buf[:len(prefix)] = prefix
+        numba_encode = _get_numba_b64encoder()
+        with memoryview(data) as view, memoryview(buf) as out:
+            pos = len(prefix)
+            encoded_up_to = 0
+            if numba_encode is not None and size > self.ENCODE_CHUNK_SIZE:
+                # Encode all whole 3-byte groups in place in one call and
+                # leave the padded remainder to the loop below
+                encoded_up_to = size - size % 3
+                with view[:encoded_up_to] as src, \
+                        out[pos:pos + encoded_up_to // 3 * 4] as dst:
+                    if digest is not None:
+                        digest.update(src)
+                    numba_encode(src, dst)
+                pos += encoded_up_to // 3 * 4
+            for start in range(encoded_up_to, size, self.ENCODE_CHUNK_SIZE):
+                with view[start:start + self.ENCODE_CHUNK_SIZE] as chunk:
+                    if digest is not None:
+                        digest.update(chunk)
+                    encoded = _b64encode(chunk)
+                out[pos:pos + len(encoded)] = encoded
+                pos += len(encoded)
+        return buf
+
+    def get_image_content_type(self, image_path, extension=None):
         """Get the correct content type based on file extension."""
-        extension = image_path.lower().split('.')[-1]
-        content_types = {
-            'png': 'image/png',
-            'jpg': 'image/jpeg',
-            'jpeg': 'image/jpeg',
-            'bmp': 'image/bmp',
-            'webp': 'image/webp',
-            'tiff': 'image/tiff',
-            'tif': 'image/tiff'
-        }
-        return content_types.get(extension, 'image/png')
+        if extension is None:
+            extension = self.get_image_extension(image_path)
+        return _CONTENT_TYPES.get(extension, 'image/png')
+
+    # Response cache methods
+    def get_cache_file(self, content_type, image_hash):
+        """Get the cache file for the current model and query on an image."""
+        cache_key = hashlib.sha256(
+            f"{self.model_name}\0{self.query_text}\0{content_type}\0{image_hash}".encode("utf-8"))
+        return self.cache_dir / f"{cache_key.hexdigest()}.txt"
+
+    def load_cached_response(self, cache_file):
+        """Load a cached response, or None if there is none."""
+        try:
+            return cache_file.read_bytes().decode("utf-8")
+        except (OSError, UnicodeDecodeError):
+            return None
+
+    def save_cached_response(self, cache_file, content):
+        """Save a response to the cache, replacing the file atomically."""
+        tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        try:
+            self.cache_dir.mkdir(exist_ok=True)
+            tmp_file.write_bytes(content.encode("utf-8"))
+            os.replace(tmp_file, cache_file)
+        except OSError as e:
+            print(f"Warning: Could not save response to {cache_file}: {e}")
+
+    @functools.cached_property
+    def aclient(self):
+        """
+        Async API client, created on first use.
+
+        Unlike the sync client it is not shared across instances by default, as
+        it is bound to the event loop it is used in; assign one to share it.
+        """
+        return AsyncOpenAI(
+            api_key=self.api_token,
+            base_url=self.base_url,
+            http_client=_make_http_client(DefaultAsyncHttpxClient),
+        )
 
     def send_messages(self, messages):
         """Send messages to the model API."""
@@ -150,11 +518,32 @@ class Eye:
             stream=True,
         )
 
-    def process_query(self):
-        """Process the image query and stream the response."""
-        self.validate_image(self.image_path)
-        base64_image = self.encode_image(self.image_path)
-        content_type = self.get_image_content_type(self.image_path)
+    async def send_messages_async(self, messages):
+        """Send messages to the model API asynchronously."""
+        return await self.aclient.chat.completions.create(
+            model=self.model_name,
+            messages=messages,
+            stream=True,
+        )
+
+    def prepare_query(self):
+        """
+        Validate and encode the image and look up any cached response.
+
+        Returns (messages, cache_file, cached_content), where cache_file is None
+        if the cache is disabled and cached_content is None on a cache miss.
+        """
+        extension = self.get_image_extension(self.image_path)
+        self.validate_image(self.image_path, extension)
+        image_url, content_type, image_hash = self._prepare_payload(
+            self.image_path, hash_image=self.use_cache)
+
+        cache_file = (self.get_cache_file(content_type, image_hash)
+                      if self.use_cache else None)
+        if cache_file is not None:
+            cached_content = self.load_cached_response(cache_file)
+            if cached_content is not None:
+                return None, cache_file, cached_content
 
         messages = [
             {
@@ -162,22 +551,94 @@ class Eye:
                 "content": [
                     {
                         "type": "image_url",
-                        "image_url": {"url": f"data:{content_type};base64,{base64_image}"},
+                        # The SDK only accepts str, so decode at the last moment
+                        "image_url": {"url": image_url.decode("ascii")},
                     },
                     {"type": "text", "text": self.query_text},
                 ],
             }
         ]
+        return messages, cache_file, None
+
+    def process_query(self):
+        """Process the image query and stream the response."""
+        messages, cache_file, cached_content = self.prepare_query()
+        # Set up output before the request is sent, so a broken stdout cannot
+        # lose a response that has already been paid for
+        output = _OutputBuffer()
+        if cached_content is not None:
+            output.write(cached_content)
+            output.flush()
+            return
 
         stream = self.send_messages(messages)
-        assistant_content = ""
+        assistant_parts = []
+
+        # Bind per-token callables once, outside the loop; the response text
+        # is only collected when it is going to be cached
+        write = output.write
+        append = assistant_parts.append if cache_file is not None else None
+        try:
+            for chunk in stream:
+                content = chunk.choices[0].delta.content
+                if content:
+                    write(content)
+                    if append is not None:
+                        append(content)
+        finally:
+            output.flush()
+        assistant_content = "".join(assistant_parts)
+
+        # Only complete responses reach this point and get cached
+        if cache_file is not None and assistant_content:
+            self.save_cached_response(cache_file, assistant_content)
+
+    async def process_query_async(self):
+        """
+        Process the image query asynchronously and return the response.
+
+        Nothing is printed, so that concurrent queries do not interleave their
+        output. Encoding runs in a worker thread to keep the event loop free.
+        """
+        messages, cache_file, cached_content = await asyncio.to_thread(self.prepare_query)
+        if cached_content is not None:
+            return cached_content
+
+        stream = await self.send_messages_async(messages)
+        assistant_parts = []
+
+        append = assistant_parts.append
+        async for chunk in stream:
+            content = chunk.choices[0].delta.content
+            if content:
+                append(content)
+        assistant_content = "".join(assistant_parts)
+
+        if cache_file is not None and assistant_content:
+            self.save_cached_response(cache_file, assistant_content)
+        return assistant_content
+
+
+def non_negative_int(value):
+    """Argument type for a pixel size, where 0 disables the feature."""
+    try:
+        number = int(value)
+    except ValueError:
+        number = -1
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must be a non-negative integer, got {value!r}")
+    return number
 
-        for chunk in stream:
-            delta = chunk.choices[0].delta
 
-            if delta.content:
-                print(delta.content, end="")
-                assistant_content += delta.content
+def jpeg_quality(value):
+    """Argument type for a JPEG quality between 1 and 95."""
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if not 1 <= number <= 95:
+        raise argparse.ArgumentTypeError(f"must be an integer from 1 to 95, got {value!r}")
+    return number
 
 
 def parse_args():
@@ -186,8 +647,13 @@ def parse_args():
         description="Process an image with VL model")
     parser.add_argument(
         "query", nargs='*', help="Query text for the image (only needs to be specified once, will be remembered)")
-    parser.add_argument("-p", "--path", required=True,
+    parser.add_argument("-q", "--query", dest="query_option", metavar="QUERY", default=None,
+                        help="Query text, as an alternative to the positional query (e.g. after --batch)")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("-p", "--path",
                         help="Path to the image file")
+    source.add_argument("--batch", metavar="GLOB", nargs='+',
+                        help="Image files or glob patterns to process concurrently, e.g. 'photos/*.jpg' (give the query before --batch or with -q)")
     parser.add_argument("-m", "--model", default=None,
                         choices=["qwen3-vl-plus", "qwen3-vl-flash",
                                  "qwen-vl-ocr-latest"],
@@ -196,22 +662,106 @@ def parse_args():
                         help="API base URL (only needs to be specified once, will be remembered)")
     parser.add_argument("--api-token", default=None,
                         help="API token for authentication (only needs to be specified once, will be remembered)")
+    parser.add_argument("--max-side", type=non_negative_int, default=None,
+                        help="Downscale images whose longer side exceeds this many pixels, 0 to disable (requires Pillow; only needs to be specified once, will be remembered)")
+    parser.add_argument("--quality", type=jpeg_quality, default=None,
+                        help="JPEG quality for downscaled images, default 85 (only needs to be specified once, will be remembered)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Always query the model instead of reusing a cached response")
 
     args = parser.parse_args()
 
+    # An unquoted glob expands into several paths, and any after the first
+    # would silently become (and be remembered as) the query text
+    for word in args.query:
+        if Eye.get_image_extension(word) in _VALID_EXTS and os.path.isfile(word):
+            parser.error(
+                f"{word} is an image file, not query text; quote glob patterns "
+                "or pass several images with --batch")
+    if args.query and args.query_option is not None:
+        parser.error("give the query either positionally or with -q/--query, not both")
+
     # Process query text
-    args.query = " ".join(args.query) if args.query else None
+    args.query = " ".join(args.query) if args.query else args.query_option
 
     return args
 
 
+def create_eye(image_path, args):
+    """Create an Eye processor for an image from command line arguments."""
+    return Eye(image_path, args.query, args.model,
+               args.base_url, args.api_token, use_cache=not args.no_cache,
+               max_side=args.max_side, quality=args.quality)
+
+
+async def main_async(args, concurrency=8):
+    """
+    Process all images matching the batch paths and glob patterns concurrently.
+
+    Each response is printed under a header as soon as it completes. Returns
+    True if every image was processed successfully.
+    """
+    paths = set()
+    for pattern in args.batch:
+        # Existing paths are taken as is, as their names may contain glob
+        # characters, e.g. photo[1].jpg
+        if os.path.exists(pattern):
+            matches = [pattern]
+        else:
+            matches = glob.glob(pattern, recursive=True)
+        # Fail before any config is saved, e.g. when query text follows --batch
+        if not matches:
+            raise FileNotFoundError(
+                f"No files match {pattern}. "
+                "Give the query before --batch or with -q.")
+        for path in matches:
+            if os.path.isfile(path) and Eye.get_image_extension(path) in _VALID_EXTS:
+                paths.add(path)
+            elif path == pattern:
+                # Named explicitly or by an unquoted glob the shell expanded
+                print(f"Warning: Skipping {path}, not a supported image file")
+    if not paths:
+        raise FileNotFoundError("No supported image files to process.")
+    paths = sorted(paths)
+
+    eyes = [create_eye(path, args) for path in paths]
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def process(eye):
+        async with semaphore:
+            try:
+                return eye.image_path, await eye.process_query_async(), None
+            except Exception as e:
+                return eye.image_path, None, e
+
+    # Share one connection pool across all queries
+    async with eyes[0].aclient as client:
+        for eye in eyes[1:]:
+            eye.aclient = client
+
+        success = True
+        for result in asyncio.as_completed([process(eye) for eye in eyes]):
+            image_path, content, error = await result
+            print(f"==> {image_path} <==")
+            if error is None:
+                print(content.rstrip("\n"))
+            else:
+                print(f"Error: {error}")
+                success = False
+            print()
+    return success
+
+
 def main():
     """Main entry point."""
     try:
         args = parse_args()
-        eye = Eye(args.path, args.query, args.model,
-                  args.base_url, args.api_token)
-        eye.process_query()
+        if args.batch is not None:
+            if not asyncio.run(main_async(args)):
+                exit(1)
+        else:
+            eye = create_eye(args.path, args)
+            eye.process_query()
     except FileNotFoundError as e:
         print(f"Error: {e}")
         exit(1)